@@ -5,6 +5,7 @@ from .models import Listing, Booking, Review
 @admin.register(Listing)
 class ListingAdmin(admin.ModelAdmin):
     list_display = ['title', 'location', 'price_per_night', 'owner', 'is_available', 'created_at']
+    list_select_related = ['owner']
     list_filter = ['property_type', 'is_available', 'created_at']
     search_fields = ['title', 'description', 'location']
     list_editable = ['is_available']
@@ -29,16 +30,23 @@ class ListingAdmin(admin.ModelAdmin):
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
-    list_display = ['id', 'listing', 'guest', 'check_in_date', 'check_out_date', 'status', 'total_price']
+    list_display = ['id', 'listing_title', 'guest', 'check_in_date', 'check_out_date', 'status', 'total_price']
+    list_select_related = ['listing', 'guest']
     list_filter = ['status', 'check_in_date', 'check_out_date']
     search_fields = ['listing__title', 'guest__username']
     readonly_fields = ['created_at']
     list_editable = ['status']
 
+    @admin.display(description='Listing', ordering='listing__title')
+    def listing_title(self, obj):
+        # Safe per row: list_select_related joins the listing
+        return obj.listing.title
+
 
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ['listing', 'user', 'rating', 'created_at']
+    list_select_related = ['listing', 'user']
     list_filter = ['rating', 'created_at']
     search_fields = ['listing__title', 'user__username', 'comment']
     readonly_fields = ['created_at', 'updated_at']
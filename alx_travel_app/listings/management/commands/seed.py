@@ -1,14 +1,26 @@
 import random
 from datetime import datetime, timedelta
 from decimal import Decimal
-from django.core.management.base import BaseCommand
+from itertools import islice
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import connection, transaction
 from django.utils import timezone
 from faker import Faker
 from ...models import Listing, Booking, Review
 
+try:
+    from django_bulk_load import bulk_insert_models
+except ImportError:  # optional, only needed for --copy
+    bulk_insert_models = None
+
 fake = Faker()
 
+SEED_PASSWORD = 'password123'
+BATCH_SIZE = 1000
+TWOPLACES = Decimal('0.01')
+
 class Command(BaseCommand):
     help = 'Seed the database with sample travel listings data'
 
@@ -37,58 +49,143 @@ class Command(BaseCommand):
             default=25,
             help='Number of reviews to create (default: 25)',
         )
+        parser.add_argument(
+            '--copy',
+            action='store_true',
+            help='Insert rows with PostgreSQL COPY (requires django-bulk-load)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help=f'Number of rows built and inserted per batch (default: {BATCH_SIZE})',
+        )
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write('🚀 Starting database seeding...')
         self.stdout.write(self.style.WARNING('This will create sample data. Continue?'))
         
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+        self.batch_size = options['batch_size']
+        self.use_copy = False
+        if options['copy']:
+            if bulk_insert_models is None:
+                self.stdout.write(self.style.WARNING(
+                    'django-bulk-load is not installed. Falling back to bulk_create.'
+                ))
+            elif connection.vendor != 'postgresql':
+                self.stdout.write(self.style.WARNING(
+                    'COPY requires PostgreSQL. Falling back to bulk_create.'
+                ))
+            else:
+                self.use_copy = True
+        
+        self._build_pools()
+        
         # Create sample users
         self._create_users(options['users'])
+        user_ids = list(User.objects.values_list('id', flat=True))
         
         # Create sample listings
-        self._create_listings(options['listings'])
+        self._create_listings(options['listings'], user_ids)
+        listing_ids = list(Listing.objects.values_list('id', flat=True))
+        listing_rows = list(
+            Listing.objects.filter(is_available=True).values_list('id', 'price_per_night')
+        )
         
         # Create sample bookings
-        self._create_bookings(options['bookings'])
+        self._create_bookings(options['bookings'], listing_rows, user_ids)
         
         # Create sample reviews
-        self._create_reviews(options['reviews'])
+        self._create_reviews(options['reviews'], listing_ids, user_ids)
         
         self.stdout.write(
             self.style.SUCCESS('✅ Database seeding completed successfully!')
         )
 
+    def _build_pools(self):
+        """Pre-generate Faker values so the seed loops only pick from lists"""
+        self.first_names = [fake.first_name() for _ in range(100)]
+        self.last_names = [fake.last_name() for _ in range(100)]
+        self.emails = [fake.email() for _ in range(200)]
+        self.cities = [fake.city() for _ in range(100)]
+        self.estate_types = [
+            'Apartment', 'Bungalow', 'Cabin', 'Chalet', 'Condo', 'Cottage',
+            'Loft', 'Studio', 'Townhouse', 'Villa'
+        ]
+        self.descriptions = [
+            fake.paragraph(nb_sentences=random.randint(2, 4)) for _ in range(200)
+        ]
+        self.comments = [
+            fake.paragraph(nb_sentences=random.randint(1, 3)) for _ in range(200)
+        ]
+
+    def _random_picks(self, population, count):
+        """Yield `count` random picks, drawing at most one batch at a time"""
+        remaining = count
+        while remaining > 0:
+            k = min(self.batch_size, remaining)
+            yield from random.choices(population, k=k)
+            remaining -= k
+
+    def _bulk_insert(self, model, objs, total, ignore_conflicts=False):
+        """
+        Insert objects from an iterable one batch at a time, with COPY when
+        enabled, otherwise with bulk_create. Reports progress once per batch
+        and returns the number of objects.
+        """
+        label = str(model._meta.verbose_name_plural).lower()
+        objs = iter(objs)
+        inserted = 0
+        while True:
+            batch = list(islice(objs, self.batch_size))
+            if not batch:
+                break
+            if self.use_copy:
+                bulk_insert_models(batch, ignore_conflicts=ignore_conflicts)
+            else:
+                model.objects.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+            inserted += len(batch)
+            self.stdout.write(f'  ✓ Created {inserted}/{total} {label}')
+        return inserted
+
     def _create_users(self, count):
         """Create sample users"""
         self.stdout.write(f'👥 Creating {count} users...')
         
-        for i in range(count):
-            username = f'travel_user_{i+1}'
-            email = fake.email()
-            
-            user, created = User.objects.get_or_create(
+        usernames = [f'travel_user_{i+1}' for i in range(count)]
+        existing = set(
+            User.objects.filter(username__in=usernames).values_list('username', flat=True)
+        )
+        
+        # Hash the shared password once, and only if there is anyone to create
+        password = make_password(SEED_PASSWORD) if len(existing) < count else None
+        
+        if existing:
+            self.stdout.write(f'  ⚠ {len(existing)} users already exist')
+        
+        users = (
+            User(
                 username=username,
-                defaults={
-                    'email': email,
-                    'first_name': fake.first_name(),
-                    'last_name': fake.last_name(),
-                }
+                email=random.choice(self.emails),
+                first_name=random.choice(self.first_names),
+                last_name=random.choice(self.last_names),
+                password=password,
             )
-            
-            if created:
-                user.set_password('password123')
-                user.save()
-                self.stdout.write(f'  ✓ Created user: {username}')
-            else:
-                self.stdout.write(f'  ⚠ User already exists: {username}')
+            for username in usernames
+            if username not in existing
+        )
+        
+        self._bulk_insert(User, users, count - len(existing), ignore_conflicts=True)
         
         self.stdout.write(self.style.SUCCESS(f'✅ Created/verified {count} users'))
 
-    def _create_listings(self, count):
+    def _create_listings(self, count, user_ids):
         """Create sample listings"""
         self.stdout.write(f'🏠 Creating {count} listings...')
         
-        users = list(User.objects.all())
         property_types = ['apartment', 'house', 'villa', 'cottage', 'hotel']
         locations = [
             'Miami Beach, FL', 'Downtown LA, CA', 'Times Square, NY',
@@ -97,94 +194,93 @@ class Command(BaseCommand):
             'Asheville, NC', 'Santa Fe, NM', 'Portland, OR'
         ]
         
-        created_count = 0
-        for i in range(count):
-            listing = Listing.objects.create(
-                title=f"{fake.real_estate_type().title()} in {fake.city()}",
-                description=fake.paragraph(nb_sentences=random.randint(2, 4)),
-                property_type=random.choice(property_types),
-                price_per_night=round(Decimal(random.uniform(45, 350)), 2),
-                bedrooms=random.randint(1, 4),
-                bathrooms=random.randint(1, 3),
-                max_guests=random.randint(2, 8),
-                location=random.choice(locations),
-                owner=random.choice(users),
-                is_available=random.choice([True, True, True, False])  # 75% available
-            )
-            
-            created_count += 1
-            if created_count % 5 == 0:
-                self.stdout.write(f'  ✓ Created {created_count}/{count} listings')
+        def listings():
+            for owner_id in self._random_picks(user_ids, count):
+                yield Listing(
+                    title=f"{random.choice(self.estate_types)} in {random.choice(self.cities)}",
+                    description=random.choice(self.descriptions),
+                    property_type=random.choice(property_types),
+                    price_per_night=round(Decimal(random.uniform(45, 350)), 2),
+                    bedrooms=random.randint(1, 4),
+                    bathrooms=random.randint(1, 3),
+                    max_guests=random.randint(2, 8),
+                    location=random.choice(locations),
+                    owner_id=owner_id,
+                    is_available=random.choice([True, True, True, False])  # 75% available
+                )
+        
+        created_count = self._bulk_insert(Listing, listings(), count)
         
         self.stdout.write(self.style.SUCCESS(f'✅ Created {created_count} listings'))
 
-    def _create_bookings(self, count):
+    def _create_bookings(self, count, listing_rows, user_ids):
         """Create sample bookings"""
         self.stdout.write(f'📅 Creating {count} bookings...')
         
-        available_listings = list(Listing.objects.filter(is_available=True))
-        users = list(User.objects.all())
-        
-        if not available_listings:
+        if not listing_rows:
             self.stdout.write(self.style.WARNING('No available listings found. Skipping bookings.'))
             return
         
-        created_count = 0
-        for i in range(count):
-            listing = random.choice(available_listings)
-            
-            # Generate dates within the last year
-            start_date = fake.date_between(start_date='-1y', end_date='-1m')
-            nights = random.randint(2, 14)
-            end_date = start_date + timedelta(days=nights)
-            
-            # Calculate total price
-            total_price = listing.total_price_for_nights(nights)
-            
-            booking = Booking.objects.create(
-                listing=listing,
-                guest=random.choice(users),
-                check_in_date=start_date,
-                check_out_date=end_date,
-                total_price=round(total_price, 2),
-                status=random.choice(['pending', 'confirmed', 'completed'])
+        today = timezone.now().date()
+        
+        def bookings():
+            picks = zip(
+                self._random_picks(listing_rows, count),
+                self._random_picks(user_ids, count),
             )
-            
-            created_count += 1
-            if created_count % 10 == 0:
-                self.stdout.write(f'  ✓ Created {created_count}/{count} bookings')
+            for (listing_id, price_per_night), guest_id in picks:
+                
+                # Generate dates within the last year
+                start_date = today - timedelta(days=random.randint(0, 365))
+                nights = random.randint(2, 14)
+                end_date = start_date + timedelta(days=nights)
+                
+                # Calculate total price
+                total_price = (price_per_night * nights).quantize(TWOPLACES)
+                
+                yield Booking(
+                    listing_id=listing_id,
+                    guest_id=guest_id,
+                    check_in_date=start_date,
+                    check_out_date=end_date,
+                    total_price=total_price,
+                    status=random.choice(['pending', 'confirmed', 'completed'])
+                )
+        
+        created_count = self._bulk_insert(Booking, bookings(), count)
         
         self.stdout.write(self.style.SUCCESS(f'✅ Created {created_count} bookings'))
 
-    def _create_reviews(self, count):
+    def _create_reviews(self, count, listing_ids, user_ids):
         """Create sample reviews"""
         self.stdout.write(f'⭐ Creating {count} reviews...')
         
-        listings = list(Listing.objects.all())
-        users = list(User.objects.all())
-        
-        if not listings:
+        if not listing_ids:
             self.stdout.write(self.style.WARNING('No listings found. Skipping reviews.'))
             return
         
-        created_count = 0
-        for i in range(count):
-            listing = random.choice(listings)
-            user = random.choice(users)
-            
-            # Skip if user already reviewed this listing
-            if Review.objects.filter(listing=listing, user=user).exists():
-                continue
-            
-            review = Review.objects.create(
-                listing=listing,
-                user=user,
-                rating=random.randint(1, 5),
-                comment=fake.paragraph(nb_sentences=random.randint(1, 3))
+        existing = set(Review.objects.values_list('listing_id', 'user_id'))
+        
+        def reviews():
+            picks = zip(
+                self._random_picks(listing_ids, count),
+                self._random_picks(user_ids, count),
             )
-            
-            created_count += 1
-            if created_count % 5 == 0:
-                self.stdout.write(f'  ✓ Created {created_count}/{count} reviews')
+            for pair in picks:
+                listing_id, user_id = pair
+                
+                # Skip if user already reviewed this listing
+                if pair in existing:
+                    continue
+                existing.add(pair)
+                
+                yield Review(
+                    listing_id=listing_id,
+                    user_id=user_id,
+                    rating=random.randint(1, 5),
+                    comment=random.choice(self.comments)
+                )
+        
+        created_count = self._bulk_insert(Review, reviews(), count, ignore_conflicts=True)
         
         self.stdout.write(self.style.SUCCESS(f'✅ Created {created_count} reviews'))
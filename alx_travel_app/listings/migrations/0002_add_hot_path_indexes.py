@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-14 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', '-created_at'], name='listings_bo_status_a32b8e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['guest', '-created_at'], name='listings_bo_guest_i_5f0fcf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['is_available', '-created_at'], name='listings_li_is_avai_92994d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['property_type', 'is_available'], name='listings_li_propert_85f7d8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['location'], name='listings_li_locatio_4bc07d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['listing', '-created_at'], name='listings_re_listing_515c5d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['rating'], name='listings_re_rating_d53460_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-14 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_add_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('listing', 'user'), name='uniq_review_listing_user'),
+        ),
+    ]
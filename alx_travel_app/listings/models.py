@@ -4,6 +4,18 @@ from django.contrib.auth.models import User
 from decimal import Decimal
 
 
+class ListingManager(models.Manager):
+    """
+    Default manager that always joins the listing owner.
+
+    Because `owner` is always traversed, it cannot be deferred: calls like
+    `only('title')` or `defer('owner')` need `select_related(None)` first.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('owner')
+
+
 class Listing(models.Model):
     PROPERTY_TYPES = [
         ('apartment', 'Apartment'),
@@ -34,16 +46,23 @@ class Listing(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ListingManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "Listings"
+        indexes = [
+            models.Index(fields=['is_available', '-created_at']),
+            models.Index(fields=['property_type', 'is_available']),
+            models.Index(fields=['location']),
+        ]
     
     def __str__(self):
         return f"{self.title} - ${self.price_per_night}/night"
 
     def total_price_for_nights(self, nights):
         """Calculate total price for specified number of nights"""
-        return self.price_per_night * Decimal(nights)
+        return self.price_per_night * nights
 
 
 class Booking(models.Model):
@@ -76,9 +95,14 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['listing', 'check_in_date', 'check_out_date']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['guest', '-created_at']),
+        ]
     
     def __str__(self):
-        return f"Booking {self.id} - {self.listing.title}"
+        return f"Booking {self.id}"
     
     def clean(self):
         """Validate booking dates"""
@@ -120,7 +144,17 @@ class Review(models.Model):
 
     class Meta:
         ordering = ['-created_at']
-        unique_together = ['listing', 'user']  # One review per user per listing
+        indexes = [
+            models.Index(fields=['listing', '-created_at']),
+            models.Index(fields=['rating']),
+        ]
+        constraints = [
+            # One review per user per listing
+            models.UniqueConstraint(
+                fields=['listing', 'user'],
+                name='uniq_review_listing_user',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.rating}/5 - {self.listing.title}"
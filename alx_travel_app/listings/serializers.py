@@ -1,5 +1,9 @@
+from decimal import Decimal
+from functools import cached_property
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import Avg, Count, Exists, OuterRef
 from .models import Listing, Booking, Review
 
 
@@ -10,6 +14,20 @@ class UserSerializer(serializers.ModelSerializer):
 
 
 class ListingSerializer(serializers.ModelSerializer):
+    """
+    Serializer for listings.
+
+    Rating fields are read from queryset annotations rather than computed
+    per object, so list querysets should be built as::
+
+        Listing.objects.select_related('owner').annotate(
+            avg_rating=Avg('reviews__rating'),
+            review_count=Count('reviews'),
+        )
+
+    Without the annotations each listing falls back to its own aggregate
+    query, which is fine for detail views but not for lists.
+    """
     owner = UserSerializer(read_only=True)
     image_url = serializers.SerializerMethodField()
     average_rating = serializers.SerializerMethodField()
@@ -26,6 +44,14 @@ class ListingSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['owner', 'created_at', 'updated_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the owner and annotate rating stats for the given queryset"""
+        return queryset.select_related('owner').annotate(
+            avg_rating=Avg('reviews__rating'),
+            review_count=Count('reviews'),
+        )
+
     def get_image_url(self, obj):
         """Get the full URL for the listing image"""
         if hasattr(obj, 'image') and obj.image:
@@ -35,29 +61,82 @@ class ListingSerializer(serializers.ModelSerializer):
         return None
 
     def get_average_rating(self, obj):
-        """Calculate average rating from reviews"""
-        reviews = obj.reviews.all()
-        if reviews.exists():
-            return sum(review.rating for review in reviews) / reviews.count()
-        return 0
+        """Get average rating, preferring the `avg_rating` annotation"""
+        if hasattr(obj, 'avg_rating'):
+            return obj.avg_rating or 0
+        return obj.reviews.aggregate(avg=Avg('rating'))['avg'] or 0
 
     def get_total_reviews(self, obj):
-        """Get total number of reviews"""
+        """Get total number of reviews, preferring the `review_count` annotation"""
+        if hasattr(obj, 'review_count'):
+            return obj.review_count
         return obj.reviews.count()
 
-    def get_total_price_for_nights(self, obj):
-        """Calculate total price for 7 nights (default)"""
+    @cached_property
+    def _nights_decimal(self):
+        """Parse the `nights` query param once per serializer (default 7)"""
         request = self.context.get('request')
-        nights = request.query_params.get('nights', 7)
+        nights = request.query_params.get('nights', 7) if request else 7
         try:
-            nights = int(nights)
-            return obj.total_price_for_nights(nights)
+            return Decimal(int(nights))
         except (ValueError, TypeError):
-            return obj.total_price_for_nights(7)
+            return Decimal(7)
+
+    def get_total_price_for_nights(self, obj):
+        """Calculate total price for the requested nights (default 7)"""
+        return obj.price_per_night * self._nights_decimal
+
+
+class ListingListSerializer(ListingSerializer):
+    """
+    Read-only listing serializer for list endpoints that works on `values()`
+    rows instead of model instances, producing the same payload as
+    `ListingSerializer`. Build the queryset with `setup_eager_loading`;
+    retrieve/detail views should keep using `ListingSerializer`.
+    """
+    # Plain model columns: everything in Meta.fields not declared as a
+    # nested or method field on ListingSerializer
+    value_fields = [
+        name for name in ListingSerializer.Meta.fields
+        if name not in ListingSerializer._declared_fields
+    ]
+    owner_fields = UserSerializer.Meta.fields
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Select listing columns, owner columns and rating stats as dicts"""
+        return queryset.values(
+            *cls.value_fields,
+            *[f'owner__{name}' for name in cls.owner_fields],
+            avg_rating=Avg('reviews__rating'),
+            review_count=Count('reviews'),
+        )
+
+    def to_representation(self, row):
+        """Assemble the listing payload from a `values()` row"""
+        fields = self.fields
+        data = {
+            name: fields[name].to_representation(row[name])
+            for name in self.value_fields
+        }
+        data['owner'] = {name: row[f'owner__{name}'] for name in self.owner_fields}
+        data['image_url'] = None
+        data['average_rating'] = row['avg_rating'] or 0
+        data['total_reviews'] = row['review_count']
+        data['total_price_for_nights'] = row['price_per_night'] * self._nights_decimal
+        return {name: data[name] for name in self.Meta.fields}
+
+
+class ListingSummarySerializer(serializers.ModelSerializer):
+    """Lightweight listing representation for nesting in other serializers"""
+
+    class Meta:
+        model = Listing
+        fields = ['id', 'title', 'location', 'price_per_night']
 
 
 class BookingSerializer(serializers.ModelSerializer):
-    listing = ListingSerializer(read_only=True)
+    listing = ListingSummarySerializer(read_only=True)
     listing_id = serializers.IntegerField(write_only=True)
     guest = UserSerializer(read_only=True)
     nights_booked = serializers.SerializerMethodField()
@@ -71,6 +150,11 @@ class BookingSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['guest', 'total_price', 'created_at', 'nights_booked']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the listing and the guest for the given queryset"""
+        return queryset.select_related('listing', 'guest')
+
     def validate(self, data):
         """Validate booking data"""
         listing_id = data.get('listing_id')
@@ -78,22 +162,24 @@ class BookingSerializer(serializers.ModelSerializer):
         check_out_date = data.get('check_out_date')
         
         if listing_id and check_in_date and check_out_date:
-            # Check for overlapping bookings
+            # Check for overlapping bookings and listing availability in one query
             overlapping_bookings = Booking.objects.filter(
-                listing_id=listing_id,
+                listing_id=OuterRef('pk'),
                 status__in=['confirmed', 'pending'],
                 check_in_date__lt=check_out_date,
                 check_out_date__gt=check_in_date
             ).exclude(pk=self.instance.pk if self.instance else None)
             
-            if overlapping_bookings.exists():
+            listing = Listing.objects.select_related(None).filter(id=listing_id).annotate(
+                has_overlap=Exists(overlapping_bookings)
+            ).first()
+            
+            if listing and listing.has_overlap:
                 raise serializers.ValidationError(
                     "This listing is not available for the selected dates."
                 )
             
-            # Check if listing is available
-            listing = Listing.objects.filter(id=listing_id, is_available=True).first()
-            if not listing:
+            if not listing or not listing.is_available:
                 raise serializers.ValidationError("This listing is not available.")
         
         return data
@@ -101,7 +187,7 @@ class BookingSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """Create booking with calculated total price"""
         listing_id = validated_data.pop('listing_id')
-        listing = Listing.objects.get(id=listing_id)
+        listing = Listing.objects.select_related(None).get(id=listing_id)
         
         nights = (validated_data['check_out_date'] - validated_data['check_in_date']).days
         total_price = listing.total_price_for_nights(nights)
@@ -116,7 +202,7 @@ class BookingSerializer(serializers.ModelSerializer):
 
 
 class ReviewSerializer(serializers.ModelSerializer):
-    listing = ListingSerializer(read_only=True)
+    listing = ListingSummarySerializer(read_only=True)
     listing_id = serializers.IntegerField(write_only=True)
     user = UserSerializer(read_only=True)
 
@@ -128,6 +214,11 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['user', 'created_at', 'updated_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the listing and the reviewer for the given queryset"""
+        return queryset.select_related('listing', 'user')
+
     def validate(self, data):
         """Validate review data"""
         listing_id = data.get('listing_id')
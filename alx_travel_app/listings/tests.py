@@ -1,3 +1,198 @@
+import random
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .models import Listing, Booking, Review
+from .serializers import BookingSerializer, ListingSerializer, ListingListSerializer
+
+
+class BookingSerializerValidateTests(TestCase):
+    """Overlap and availability checks in BookingSerializer.validate"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', password='password123')
+        cls.guest = User.objects.create_user('guest', password='password123')
+        cls.listing = cls.make_listing(is_available=True)
+        cls.unavailable = cls.make_listing(is_available=False)
+
+    @classmethod
+    def make_listing(cls, is_available):
+        return Listing.objects.create(
+            title='Test listing',
+            description='A place to stay',
+            property_type='apartment',
+            price_per_night=Decimal('100.00'),
+            location='Portland, OR',
+            owner=cls.owner,
+            is_available=is_available,
+        )
+
+    def make_booking(self, listing, check_in, check_out):
+        return Booking.objects.create(
+            listing=listing,
+            guest=self.guest,
+            check_in_date=check_in,
+            check_out_date=check_out,
+            total_price=Decimal('100.00'),
+            status='confirmed',
+        )
+
+    def validate(self, listing_id, check_in, check_out, instance=None):
+        serializer = BookingSerializer(instance, data={
+            'listing_id': listing_id,
+            'check_in_date': check_in.isoformat(),
+            'check_out_date': check_out.isoformat(),
+        })
+        serializer.is_valid()
+        return serializer.errors.get('non_field_errors', [])
+
+    def test_free_dates_on_available_listing(self):
+        self.assertEqual(
+            self.validate(self.listing.id, date(2026, 1, 1), date(2026, 1, 5)), []
+        )
+
+    def test_overlap_on_available_listing(self):
+        self.make_booking(self.listing, date(2026, 1, 3), date(2026, 1, 8))
+        self.assertEqual(
+            self.validate(self.listing.id, date(2026, 1, 1), date(2026, 1, 5)),
+            ['This listing is not available for the selected dates.'],
+        )
+
+    def test_unavailable_listing_without_overlap(self):
+        self.assertEqual(
+            self.validate(self.unavailable.id, date(2026, 1, 1), date(2026, 1, 5)),
+            ['This listing is not available.'],
+        )
+
+    def test_unavailable_listing_with_overlap(self):
+        self.make_booking(self.unavailable, date(2026, 1, 3), date(2026, 1, 8))
+        self.assertEqual(
+            self.validate(self.unavailable.id, date(2026, 1, 1), date(2026, 1, 5)),
+            ['This listing is not available for the selected dates.'],
+        )
+
+    def test_nonexistent_listing(self):
+        missing_id = Listing.objects.order_by('-id').values_list('id', flat=True)[0] + 1
+        self.assertEqual(
+            self.validate(missing_id, date(2026, 1, 1), date(2026, 1, 5)),
+            ['This listing is not available.'],
+        )
+
+    def test_update_excludes_own_booking(self):
+        booking = self.make_booking(self.listing, date(2026, 1, 3), date(2026, 1, 8))
+        self.assertEqual(
+            self.validate(
+                self.listing.id, date(2026, 1, 4), date(2026, 1, 9), instance=booking
+            ),
+            [],
+        )
+
+    def test_update_still_checks_other_bookings(self):
+        booking = self.make_booking(self.listing, date(2026, 1, 3), date(2026, 1, 8))
+        self.make_booking(self.listing, date(2026, 1, 10), date(2026, 1, 12))
+        self.assertEqual(
+            self.validate(
+                self.listing.id, date(2026, 1, 4), date(2026, 1, 11), instance=booking
+            ),
+            ['This listing is not available for the selected dates.'],
+        )
+
+    def test_validate_uses_one_query(self):
+        with self.assertNumQueries(1):
+            self.validate(self.listing.id, date(2026, 1, 1), date(2026, 1, 5))
+
+
+class ListingListSerializerTests(TestCase):
+    """ListingListSerializer must render the same payload as ListingSerializer"""
+
+    @classmethod
+    def setUpTestData(cls):
+        owners = [
+            User.objects.create_user(f'owner_{i}', email=f'owner_{i}@example.com')
+            for i in range(2)
+        ]
+        for i, price in enumerate(['45.50', '120.00', '349.99']):
+            listing = Listing.objects.create(
+                title=f'Listing {i}',
+                description='A place to stay',
+                property_type='house',
+                price_per_night=Decimal(price),
+                location='Key West, FL',
+                owner=owners[i % 2],
+                is_available=bool(i % 2),
+            )
+            for rating, user in zip([5, 2][:i], owners):
+                Review.objects.create(
+                    listing=listing, user=user, rating=rating, comment='Nice'
+                )
+
+    def render_both(self, context=None):
+        context = context or {}
+        full = ListingSerializer(
+            ListingSerializer.setup_eager_loading(Listing.objects.all()),
+            many=True, context=context,
+        )
+        rows = ListingListSerializer(
+            ListingListSerializer.setup_eager_loading(Listing.objects.all()),
+            many=True, context=context,
+        )
+        renderer = JSONRenderer()
+        return renderer.render(full.data), renderer.render(rows.data)
+
+    def test_matches_listing_serializer(self):
+        full, rows = self.render_both()
+        self.assertEqual(rows, full)
+
+    def test_matches_listing_serializer_with_nights(self):
+        request = Request(APIRequestFactory().get('/listings/', {'nights': 3}))
+        full, rows = self.render_both({'request': request})
+        self.assertEqual(rows, full)
+
+
+class SeedCommandTests(TestCase):
+    """End-to-end runs of the `seed` management command"""
+
+    def setUp(self):
+        random.seed(0)
+
+    def seed(self, **options):
+        options = {
+            'users': 3, 'listings': 5, 'bookings': 5, 'reviews': 10,
+            'batch_size': 2, **options,
+        }
+        call_command('seed', stdout=StringIO(), **options)
+
+    def test_creates_requested_rows(self):
+        self.seed()
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Listing.objects.count(), 5)
+        self.assertEqual(Booking.objects.count(), 5)
+        self.assertTrue(0 < Review.objects.count() <= 10)
+
+    def test_users_share_a_working_password_hash(self):
+        self.seed()
+        users = list(User.objects.all())
+        self.assertEqual(len({user.password for user in users}), 1)
+        self.assertTrue(users[0].check_password('password123'))
+
+    def test_second_run_adds_no_duplicate_users_or_reviews(self):
+        self.seed()
+        self.seed()
+        self.assertEqual(User.objects.count(), 3)
+        pairs = list(Review.objects.values_list('listing_id', 'user_id'))
+        self.assertEqual(len(pairs), len(set(pairs)))
 
-# Create your tests here.
+    def test_rejects_batch_size_below_one(self):
+        with self.assertRaises(CommandError):
+            self.seed(batch_size=0)
+        self.assertFalse(Listing.objects.exists())